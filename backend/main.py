@@ -72,8 +72,8 @@ class DataAccessResponse(BaseModel):
     available_modules: List[str]
     records_available: int
 
-# Global variables for tracking
-start_time = time.time()
+# Global variables for tracking (monotonic so uptime is immune to clock changes)
+start_time = time.monotonic()
 
 # Sample mock data for testing
 MOCK_LOBBY_DATA = [
@@ -129,6 +129,30 @@ MOCK_LOBBY_DATA = [
     }
 ]
 
+# Mock analytics data served by the /v1/analytics endpoints
+MOCK_TREND_DATA = [
+    {"date": "2025-09-01", "amount": 450000, "count": 12},
+    {"date": "2025-09-08", "amount": 520000, "count": 15},
+    {"date": "2025-09-15", "amount": 380000, "count": 10},
+    {"date": "2025-09-22", "amount": 610000, "count": 18},
+]
+
+MOCK_ORGANIZATION_DATA = [
+    {"organization": "California Healthcare Association", "total_amount": 250000, "transaction_count": 5, "percentage_of_total": 25.5},
+    {"organization": "Environmental Defense Fund", "total_amount": 320000, "transaction_count": 8, "percentage_of_total": 32.6},
+    {"organization": "California Teachers Association", "total_amount": 420000, "transaction_count": 12, "percentage_of_total": 42.9},
+]
+
+# Lowercased searchable text per record, built once so queries don't re-lower
+# every field on each request. Fields are NUL-separated so a query can't match
+# across field boundaries.
+MOCK_SEARCH_TEXT = {
+    record["id"]: "\0".join(
+        [record["organization"], record["lobbyist"], record["description"], *record["issues"]]
+    ).lower()
+    for record in MOCK_LOBBY_DATA
+}
+
 # API Routes
 
 @app.get("/", response_model=Dict[str, str])
@@ -145,7 +169,7 @@ async def root():
 async def health_check():
     """Health check endpoint for monitoring"""
     current_time = time.time()
-    uptime = current_time - start_time
+    uptime = time.monotonic() - start_time
 
     return HealthResponse(
         status="healthy",
@@ -191,57 +215,41 @@ async def search_lobby_data(
     limit: int = Query(25, ge=1, le=100, description="Results per page")
 ):
     """Search lobby data with filters"""
-    search_start_time = time.time()
+    search_start_time = time.perf_counter()
 
-    # Filter mock data based on parameters
-    filtered_data = MOCK_LOBBY_DATA.copy()
+    # Collect the active filters, then filter mock data in a single pass
+    predicates = []
 
     # Apply query filter (simple text search)
     if query:
         query_lower = query.lower()
-        filtered_data = [
-            record for record in filtered_data
-            if (query_lower in record["organization"].lower() or
-                query_lower in record["lobbyist"].lower() or
-                query_lower in record["description"].lower() or
-                any(query_lower in issue.lower() for issue in record["issues"]))
-        ]
+        predicates.append(lambda record: query_lower in MOCK_SEARCH_TEXT[record["id"]])
 
     # Apply category filter
     if category and category != "all":
-        filtered_data = [
-            record for record in filtered_data
-            if record["category"] == category
-        ]
+        predicates.append(lambda record: record["category"] == category)
 
     # Apply organization filter
     if organization:
         org_lower = organization.lower()
-        filtered_data = [
-            record for record in filtered_data
-            if org_lower in record["organization"].lower()
-        ]
+        predicates.append(lambda record: org_lower in record["organization"].lower())
 
     # Apply lobbyist filter
     if lobbyist:
         lobbyist_lower = lobbyist.lower()
-        filtered_data = [
-            record for record in filtered_data
-            if lobbyist_lower in record["lobbyist"].lower()
-        ]
+        predicates.append(lambda record: lobbyist_lower in record["lobbyist"].lower())
 
     # Apply amount filters
     if amount_min is not None:
-        filtered_data = [
-            record for record in filtered_data
-            if record["amount"] >= amount_min
-        ]
+        predicates.append(lambda record: record["amount"] >= amount_min)
 
     if amount_max is not None:
-        filtered_data = [
-            record for record in filtered_data
-            if record["amount"] <= amount_max
-        ]
+        predicates.append(lambda record: record["amount"] <= amount_max)
+
+    filtered_data = [
+        record for record in MOCK_LOBBY_DATA
+        if all(predicate(record) for predicate in predicates)
+    ]
 
     # Calculate pagination
     total_results = len(filtered_data)
@@ -250,7 +258,7 @@ async def search_lobby_data(
     paginated_data = filtered_data[start_index:end_index]
 
     # Calculate search time
-    search_time_ms = round((time.time() - search_start_time) * 1000, 2)
+    search_time_ms = round((time.perf_counter() - search_start_time) * 1000, 2)
 
     return SearchResponse(
         data=[LobbyRecord(**record) for record in paginated_data],
@@ -281,17 +289,9 @@ async def get_trends(
     category: Optional[str] = Query(None, description="Category filter")
 ):
     """Get lobby expenditure trends"""
-    # Mock trend data
-    trend_data = [
-        {"date": "2025-09-01", "amount": 450000, "count": 12},
-        {"date": "2025-09-08", "amount": 520000, "count": 15},
-        {"date": "2025-09-15", "amount": 380000, "count": 10},
-        {"date": "2025-09-22", "amount": 610000, "count": 18},
-    ]
-
     return {
         "timeframe": timeframe,
-        "data": trend_data
+        "data": MOCK_TREND_DATA
     }
 
 @app.get("/v1/analytics/organizations")
@@ -300,16 +300,9 @@ async def get_organization_analytics(
     timeframe: str = Query("year", description="Timeframe for analysis")
 ):
     """Get top organizations by spending"""
-    # Mock organization data
-    org_data = [
-        {"organization": "California Healthcare Association", "total_amount": 250000, "transaction_count": 5, "percentage_of_total": 25.5},
-        {"organization": "Environmental Defense Fund", "total_amount": 320000, "transaction_count": 8, "percentage_of_total": 32.6},
-        {"organization": "California Teachers Association", "total_amount": 420000, "transaction_count": 12, "percentage_of_total": 42.9},
-    ]
-
     return {
         "timeframe": timeframe,
-        "data": org_data[:limit]
+        "data": MOCK_ORGANIZATION_DATA[:limit]
     }
 
 # Error handlers
@@ -22,6 +22,10 @@ logger = logging.getLogger(__name__)
 # Create blueprint for search endpoints
 search_bp = Blueprint('search', __name__, url_prefix='/api/search')
 
+# Accepted values for request validation
+SUGGESTION_TYPES = frozenset({'lobbyist', 'client'})
+EXPORT_FORMATS = frozenset({'csv', 'json', 'xlsx'})
+
 @search_bp.route('/', methods=['GET'])
 @handle_api_errors
 def search_lobby_data():
@@ -151,13 +155,8 @@ def advanced_search():
     try:
         data_service = get_data_service()
 
-        if query_type == 'complex':
-            results = _execute_complex_search(data_service, parameters)
-        elif query_type == 'aggregation':
-            results = _execute_aggregation_query(data_service, parameters)
-        elif query_type == 'analytics':
-            results = _execute_analytics_query(data_service, parameters)
-        else:
+        handler = ADVANCED_QUERY_HANDLERS.get(query_type) if isinstance(query_type, str) else None
+        if handler is None:
             return jsonify({
                 'error': 'Invalid query type',
                 'message': 'query_type must be one of: complex, aggregation, analytics',
@@ -165,6 +164,8 @@ def advanced_search():
                 'timestamp': datetime.utcnow().isoformat()
             }), 400
 
+        results = handler(data_service, parameters)
+
         response_data = {
             'success': True,
             'query_type': query_type,
@@ -223,6 +224,13 @@ def _execute_analytics_query(data_service, parameters):
         }
     }
 
+# Dispatch table for advanced search query types
+ADVANCED_QUERY_HANDLERS = {
+    'complex': _execute_complex_search,
+    'aggregation': _execute_aggregation_query,
+    'analytics': _execute_analytics_query
+}
+
 @search_bp.route('/suggestions', methods=['GET'])
 @handle_api_errors
 def get_search_suggestions():
@@ -237,7 +245,7 @@ def get_search_suggestions():
     suggestion_type = request.args.get('type', '').lower()
     search_term = request.args.get('q', '').strip()
 
-    if suggestion_type not in ['lobbyist', 'client']:
+    if suggestion_type not in SUGGESTION_TYPES:
         return jsonify({
             'error': 'Invalid suggestion type',
             'message': 'type must be either "lobbyist" or "client"',
@@ -307,7 +315,7 @@ def export_search_results():
     filters = data.get('filters', {})
     limit = min(10000, data.get('limit', 1000))  # Max 10k records for export
 
-    if export_format not in ['csv', 'json', 'xlsx']:
+    if export_format not in EXPORT_FORMATS:
         return jsonify({
             'error': 'Invalid export format',
             'message': 'format must be one of: csv, json, xlsx',
@@ -320,19 +328,22 @@ def export_search_results():
         data_service = get_data_service()
         results = data_service.get_lobby_data(filters, limit, 0)
 
+        # Single timestamp so the payload and the download filename agree
+        generated_at = datetime.utcnow()
+
         # Prepare export data
         export_data = {
             'success': True,
             'format': export_format,
             'record_count': len(results['data']),
             'filters_applied': results['filters_applied'],
-            'generated_at': datetime.utcnow().isoformat(),
+            'generated_at': generated_at.isoformat(),
             'data': results['data']
         }
 
         # Set appropriate response headers for download
         response = jsonify(export_data)
-        response.headers['Content-Disposition'] = f'attachment; filename=lobby_export_{datetime.utcnow().strftime("%Y%m%d_%H%M%S")}.json'
+        response.headers['Content-Disposition'] = f'attachment; filename=lobby_export_{generated_at.strftime("%Y%m%d_%H%M%S")}.json'
 
         logger.info(f"Export generated: {export_format}, {len(results['data'])} records")
         return response
@@ -14,7 +14,10 @@ from flask import Flask, jsonify, request
 from flask_cors import CORS
 from dotenv import load_dotenv
 import os
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 
 # Import Phase 1.1 integrated modules
@@ -24,6 +27,9 @@ from middleware import setup_middleware, handle_api_errors
 # Load environment variables
 load_dotenv()
 
+# Optional background listener that performs log I/O off the request threads
+_log_listener = None
+
 def create_app():
     """
     Application factory pattern for Flask app creation.
@@ -68,13 +74,29 @@ def configure_logging(app):
     os.makedirs('logs', exist_ok=True)
     log_path = os.path.join('logs', log_file)
 
+    handlers = [
+        logging.FileHandler(log_path),
+        logging.StreamHandler()
+    ]
+
+    # Long-running servers (e.g. run.py, gunicorn) can opt in to writing logs
+    # from a listener thread. Off by default: serverless hosts such as Vercel
+    # may freeze or kill the process before queued records are flushed.
+    # basicConfig is a no-op when the root logger already has handlers, so the
+    # listener is only started when its QueueHandler will actually be installed.
+    global _log_listener
+    use_queue = os.getenv('LOG_QUEUE', 'false').lower() == 'true'
+    if use_queue and _log_listener is None and not logging.getLogger().handlers:
+        log_queue = queue.Queue(-1)
+        _log_listener = QueueListener(log_queue, *handlers)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+        handlers = [QueueHandler(log_queue)]
+
     logging.basicConfig(
         level=getattr(logging, log_level),
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_path),
-            logging.StreamHandler()
-        ]
+        handlers=handlers
     )
 
     app.logger.info(f"✅ Logging configured: {log_level} level, file: {log_path}")
@@ -13,8 +13,10 @@ Based on:
 import os
 import jwt
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 from functools import wraps
+from typing import Optional
 from flask import request, jsonify, current_app, g
 from datetime import datetime
 import time
@@ -32,6 +34,16 @@ class ClerkAuth:
         self.clerk_publishable_key = os.getenv('CLERK_PUBLISHABLE_KEY')
         self.clerk_jwt_key = os.getenv('CLERK_JWT_KEY')
 
+        # Reuse one pooled session so Clerk calls skip the TCP/TLS handshake
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+        # Clerk signing keys rotate rarely; cache the JWKS instead of fetching per token
+        self.jwks_cache_ttl = int(os.getenv('CLERK_JWKS_CACHE_TTL', 300))
+        self._jwks_cache = None  # (fetched_at, jwks)
+        # Minimum age before an unknown kid may force a refetch (bounds forged-kid traffic)
+        self.jwks_min_refresh_interval = 10
+
         if not self.clerk_secret_key:
             logger.warning("CLERK_SECRET_KEY not configured - authentication will be in mock mode")
             self.mock_mode = True
@@ -49,27 +61,19 @@ class ClerkAuth:
 
         try:
             # Get Clerk's public key for JWT verification
-            clerk_jwks_url = "https://api.clerk.dev/v1/jwks"
-            response = requests.get(clerk_jwks_url, timeout=5)
-            response.raise_for_status()
-            jwks = response.json()
+            jwks = self._get_jwks()
 
             # Decode the JWT token
             unverified_header = jwt.get_unverified_header(token)
             kid = unverified_header.get('kid')
 
             # Find the right key
-            rsa_key = None
-            for key in jwks['keys']:
-                if key['kid'] == kid:
-                    rsa_key = {
-                        'kty': key['kty'],
-                        'kid': key['kid'],
-                        'use': key['use'],
-                        'n': key['n'],
-                        'e': key['e']
-                    }
-                    break
+            rsa_key = self._find_signing_key(jwks, kid)
+
+            if not rsa_key:
+                # The key may have been rotated in since the JWKS was cached
+                jwks = self._get_jwks(force_refresh=True)
+                rsa_key = self._find_signing_key(jwks, kid)
 
             if not rsa_key:
                 raise ValueError("Unable to find appropriate key")
@@ -107,6 +111,39 @@ class ClerkAuth:
             logger.error(f"Token verification error: {e}")
             raise ValueError("Token verification failed")
 
+    def _get_jwks(self, force_refresh: bool = False) -> dict:
+        """
+        Get Clerk's JWKS, served from cache while younger than jwks_cache_ttl.
+        force_refresh bypasses the cache, but at most once per
+        jwks_min_refresh_interval seconds.
+        """
+        cached = self._jwks_cache
+        if cached:
+            age = time.monotonic() - cached[0]
+            if age < self.jwks_cache_ttl and (not force_refresh or age < self.jwks_min_refresh_interval):
+                return cached[1]
+
+        clerk_jwks_url = "https://api.clerk.dev/v1/jwks"
+        response = self.session.get(clerk_jwks_url, timeout=5)
+        response.raise_for_status()
+        jwks = response.json()
+
+        self._jwks_cache = (time.monotonic(), jwks)
+        return jwks
+
+    def _find_signing_key(self, jwks: dict, kid: str) -> Optional[dict]:
+        """Return the RSA key matching kid from the JWKS, or None if absent."""
+        for key in jwks['keys']:
+            if key['kid'] == kid:
+                return {
+                    'kty': key['kty'],
+                    'kid': key['kid'],
+                    'use': key['use'],
+                    'n': key['n'],
+                    'e': key['e']
+                }
+        return None
+
     def _mock_user_verification(self, token: str) -> dict:
         """
         Mock user verification for development/testing.
@@ -138,10 +175,11 @@ class ClerkAuth:
             }
 
             user_data = mock_users.get(user_type, mock_users['user'])
+            now = int(time.time())
             user_data.update({
-                'session_id': f'mock_session_{int(time.time())}',
-                'exp': int(time.time()) + 3600,  # 1 hour from now
-                'iat': int(time.time())
+                'session_id': f'mock_session_{now}',
+                'exp': now + 3600,  # 1 hour from now
+                'iat': now
             })
 
             logger.info(f"🔧 Mock authentication: {user_type} user")
@@ -170,7 +208,7 @@ class ClerkAuth:
                 'Content-Type': 'application/json'
             }
 
-            response = requests.get(
+            response = self.session.get(
                 f'https://api.clerk.dev/v1/users/{user_id}',
                 headers=headers,
                 timeout=5
@@ -12,10 +12,10 @@ Based on:
 """
 
 import logging
+import re
 import time
 from functools import lru_cache
-from datetime import datetime, timedelta
-import pandas as pd
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 import json
 
@@ -23,6 +23,34 @@ from database import get_database
 
 logger = logging.getLogger(__name__)
 
+# Static query templates, built once at import rather than per request
+LOBBY_DATA_QUERY = """
+        SELECT
+            lobbyist_name,
+            client_name,
+            amount,
+            report_date,
+            activity_description,
+            payment_type
+        FROM `{project}.{dataset}.lobby_data`
+        """.strip()
+
+LOBBY_COUNT_QUERY = "SELECT COUNT(*) as total FROM `{project}.{dataset}.lobby_data`"
+
+# Filter key -> WHERE clause builder for lobby queries (Phase 1.1 validation patterns)
+LOBBY_FILTER_CLAUSES = (
+    ('lobbyist_name', lambda value: f"LOWER(lobbyist_name) LIKE '%{value.lower()}%'"),
+    ('client_name', lambda value: f"LOWER(client_name) LIKE '%{value.lower()}%'"),
+    ('amount_min', lambda value: f"amount >= {value}"),
+    ('amount_max', lambda value: f"amount <= {value}"),
+    ('date_from', lambda value: f"report_date >= '{value}'"),
+    ('date_to', lambda value: f"report_date <= '{value}'"),
+)
+
+# Column-name standardization patterns, compiled once (applied per column per row)
+NON_WORD_CHARS = re.compile(r'[^\w]')
+REPEATED_UNDERSCORES = re.compile(r'_+')
+
 class DataAccessService:
     """
     Data access service layer implementing Phase 1.1 patterns.
@@ -47,18 +75,17 @@ class DataAccessService:
         if 'timestamp' not in cache_entry:
             return False
 
-        cache_time = cache_entry['timestamp']
-        expiry_time = cache_time + timedelta(seconds=self.cache_ttl)
-        return datetime.utcnow() < expiry_time
+        # Monotonic clock so NTP adjustments cannot expire or extend entries
+        return time.monotonic() - cache_entry['timestamp'] < self.cache_ttl
 
     def _cache_result(self, cache_key: str, data: Any) -> None:
         """Cache query result with timestamp."""
         self.cache[cache_key] = {
             'data': data,
-            'timestamp': datetime.utcnow(),
+            'timestamp': time.monotonic(),
             'hits': 0
         }
-        logger.debug(f"Cached result for key: {cache_key[:50]}...")
+        logger.debug("Cached result for key: %.50s...", cache_key)
 
     def _get_cached_result(self, cache_key: str) -> Optional[Any]:
         """Retrieve cached result if valid."""
@@ -68,12 +95,12 @@ class DataAccessService:
         cache_entry = self.cache[cache_key]
         if not self._is_cache_valid(cache_entry):
             del self.cache[cache_key]
-            logger.debug(f"Cache expired for key: {cache_key[:50]}...")
+            logger.debug("Cache expired for key: %.50s...", cache_key)
             return None
 
         # Update hit counter
         cache_entry['hits'] += 1
-        logger.debug(f"Cache hit for key: {cache_key[:50]}... (hits: {cache_entry['hits']})")
+        logger.debug("Cache hit for key: %.50s... (hits: %d)", cache_key, cache_entry['hits'])
         return cache_entry['data']
 
     def execute_cached_query(self, query: str, params: Dict = None) -> Optional[List[Dict]]:
@@ -90,9 +117,9 @@ class DataAccessService:
             return cached_result
 
         # Execute query if not cached
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = self.db.execute_query(query)
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
 
         if results is None:
             logger.warning(f"Query returned no results: {query[:100]}...")
@@ -148,11 +175,10 @@ class DataAccessService:
         standardized = column_name.lower().replace(' ', '_').replace('-', '_')
 
         # Remove special characters
-        import re
-        standardized = re.sub(r'[^\w]', '_', standardized)
+        standardized = NON_WORD_CHARS.sub('_', standardized)
 
         # Remove multiple underscores
-        standardized = re.sub(r'_+', '_', standardized).strip('_')
+        standardized = REPEATED_UNDERSCORES.sub('_', standardized).strip('_')
 
         return standardized
 
@@ -203,10 +229,14 @@ class DataAccessService:
                     'filters_applied': filters or {}
                 }
 
-            # Get total count for pagination
-            count_query = self._build_lobby_count_query(filters)
-            count_result = self.execute_cached_query(count_query, {'filters': filters})
-            total_count = count_result[0]['total'] if count_result else len(results)
+            # Get total count for pagination. A short page is the last page, so
+            # the total is known without running the COUNT(*) query.
+            if len(results) < limit and (results or offset == 0):
+                total_count = offset + len(results)
+            else:
+                count_query = self._build_lobby_count_query(filters)
+                count_result = self.execute_cached_query(count_query, {'filters': filters})
+                total_count = count_result[0]['total'] if count_result else len(results)
 
             return {
                 'data': results,
@@ -227,42 +257,7 @@ class DataAccessService:
         Applies Phase 1.1 data selection patterns.
         """
         # Base query (mock data mode will return sample data)
-        base_query = """
-        SELECT
-            lobbyist_name,
-            client_name,
-            amount,
-            report_date,
-            activity_description,
-            payment_type
-        FROM `{project}.{dataset}.lobby_data`
-        """.strip()
-
-        where_clauses = []
-
-        if filters:
-            # Apply filters following Phase 1.1 validation patterns
-            if 'lobbyist_name' in filters:
-                where_clauses.append(f"LOWER(lobbyist_name) LIKE '%{filters['lobbyist_name'].lower()}%'")
-
-            if 'client_name' in filters:
-                where_clauses.append(f"LOWER(client_name) LIKE '%{filters['client_name'].lower()}%'")
-
-            if 'amount_min' in filters:
-                where_clauses.append(f"amount >= {filters['amount_min']}")
-
-            if 'amount_max' in filters:
-                where_clauses.append(f"amount <= {filters['amount_max']}")
-
-            if 'date_from' in filters:
-                where_clauses.append(f"report_date >= '{filters['date_from']}'")
-
-            if 'date_to' in filters:
-                where_clauses.append(f"report_date <= '{filters['date_to']}'")
-
-        # Add WHERE clause if filters exist
-        if where_clauses:
-            base_query += " WHERE " + " AND ".join(where_clauses)
+        base_query = LOBBY_DATA_QUERY + self._build_where_clause(filters)
 
         # Add ordering and pagination
         base_query += " ORDER BY report_date DESC, amount DESC"
@@ -272,27 +267,23 @@ class DataAccessService:
 
     def _build_lobby_count_query(self, filters: Dict = None) -> str:
         """Build count query for pagination."""
-        base_query = "SELECT COUNT(*) as total FROM `{project}.{dataset}.lobby_data`"
-
-        where_clauses = []
-        if filters:
-            if 'lobbyist_name' in filters:
-                where_clauses.append(f"LOWER(lobbyist_name) LIKE '%{filters['lobbyist_name'].lower()}%'")
-            if 'client_name' in filters:
-                where_clauses.append(f"LOWER(client_name) LIKE '%{filters['client_name'].lower()}%'")
-            if 'amount_min' in filters:
-                where_clauses.append(f"amount >= {filters['amount_min']}")
-            if 'amount_max' in filters:
-                where_clauses.append(f"amount <= {filters['amount_max']}")
-            if 'date_from' in filters:
-                where_clauses.append(f"report_date >= '{filters['date_from']}'")
-            if 'date_to' in filters:
-                where_clauses.append(f"report_date <= '{filters['date_to']}'")
-
-        if where_clauses:
-            base_query += " WHERE " + " AND ".join(where_clauses)
+        return LOBBY_COUNT_QUERY + self._build_where_clause(filters)
 
-        return base_query
+    def _build_where_clause(self, filters: Dict = None) -> str:
+        """
+        Build the WHERE clause shared by the lobby data and count queries.
+        Clauses come from LOBBY_FILTER_CLAUSES; returns '' when no filters apply.
+        """
+        where_clauses = [
+            build_clause(filters[key])
+            for key, build_clause in LOBBY_FILTER_CLAUSES
+            if key in filters
+        ] if filters else []
+
+        if not where_clauses:
+            return ""
+
+        return " WHERE " + " AND ".join(where_clauses)
 
     def get_cache_stats(self) -> Dict:
         """Get cache performance statistics."""
@@ -37,6 +37,18 @@ class DatabaseConnection:
         self.dataset_id = os.getenv('BIGQUERY_DATASET', 'ca_lobby')
         self.use_mock_data = os.getenv('USE_MOCK_DATA', 'false').lower() == 'true'
 
+        # /health and /api/status both probe BigQuery; reuse the last healthy result briefly
+        self.health_check_ttl = int(os.getenv('HEALTH_CHECK_CACHE_TTL', 30))
+        self._health_cache = None  # (checked_at, status)
+
+        # Back off reconnect attempts once BigQuery has failed repeatedly, so a
+        # single transient error doesn't make queries return no data for a while
+        self.reconnect_failure_threshold = 3
+        self.reconnect_backoff_base = 5
+        self.reconnect_backoff_max = 300
+        self._connect_failures = 0
+        self._next_connect_attempt = 0.0
+
     def initialize_connection(self):
         """
         Initialize BigQuery connection using Phase 1.1 patterns.
@@ -62,10 +74,12 @@ class DatabaseConnection:
             self.project_id = credentials.project_id
 
             # Initialize BigQuery client
-            self.client = bigquery.Client(credentials=credentials, project=self.project_id)
+            client = bigquery.Client(credentials=credentials, project=self.project_id)
 
-            # Test connection by listing datasets (Phase 1.1 validation pattern)
-            datasets = list(self.client.list_datasets())
+            # Test connection by listing datasets (Phase 1.1 validation pattern);
+            # only keep the client once the probe succeeds
+            datasets = list(client.list_datasets())
+            self.client = client
             logger.info(f"✅ Connected to BigQuery project: {self.project_id}")
             logger.info(f"Available datasets: {[dataset.dataset_id for dataset in datasets]}")
 
@@ -84,14 +98,34 @@ class DatabaseConnection:
     def get_client(self):
         """
         Get or create database client with connection retry logic.
+        After reconnect_failure_threshold consecutive failures, attempts back
+        off exponentially (5s doubling to 300s) so requests don't each pay for
+        a reconnect while BigQuery is down.
         Follows Phase 1.1 error recovery patterns.
         """
         if self.use_mock_data:
             return None
 
         if self.client is None:
+            # Skip the attempt while backing off after previous failures
+            if time.monotonic() < self._next_connect_attempt:
+                return None
+
             self.initialize_connection()
 
+            if self.client is None:
+                self._connect_failures += 1
+                excess = self._connect_failures - self.reconnect_failure_threshold
+                if excess >= 0:
+                    backoff = min(
+                        self.reconnect_backoff_max,
+                        self.reconnect_backoff_base * 2 ** excess
+                    )
+                    self._next_connect_attempt = time.monotonic() + backoff
+                    logger.warning(f"⚠️ Database connection unavailable - next attempt in {backoff}s")
+            else:
+                self._connect_failures = 0
+
         return self.client
 
     @lru_cache(maxsize=100)
@@ -131,12 +165,12 @@ class DatabaseConnection:
                 job_config.use_legacy_sql = False
 
                 logger.info(f"🔍 Executing query (attempt {attempt + 1}/{retry_count})")
-                logger.debug(f"Query: {query_string[:200]}...")
+                logger.debug("Query: %.200s...", query_string)
 
-                start_time = time.time()
+                start_time = time.perf_counter()
                 query_job = client.query(query_string, job_config=job_config)
                 results = query_job.result()
-                execution_time = time.time() - start_time
+                execution_time = time.perf_counter() - start_time
 
                 logger.info(f"✅ Query executed successfully in {execution_time:.2f}s")
                 return results
@@ -198,6 +232,9 @@ class DatabaseConnection:
         """
         Perform database health check.
         Returns status information for monitoring purposes.
+        Healthy results are reused for health_check_ttl seconds so frequent
+        polling does not issue a BigQuery query per request; failures are
+        never cached so recovery is reported on the next check.
         """
         if self.use_mock_data:
             return {
@@ -206,6 +243,19 @@ class DatabaseConnection:
                 'timestamp': datetime.utcnow().isoformat()
             }
 
+        cached = self._health_cache
+        if cached and time.monotonic() - cached[0] < self.health_check_ttl:
+            return cached[1]
+
+        status = self._check_connection_health()
+        if status['status'] == 'healthy':
+            self._health_cache = (time.monotonic(), status)
+        else:
+            self._health_cache = None
+        return status
+
+    def _check_connection_health(self):
+        """Run the live connection check against BigQuery."""
         try:
             client = self.get_client()
             if client is None:
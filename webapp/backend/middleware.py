@@ -98,20 +98,20 @@ def register_request_middleware(app):
     @app.before_request
     def log_request():
         """Log incoming requests with timing information."""
-        g.start_time = time.time()
+        g.start_time = time.perf_counter()
         g.request_id = f"req_{int(time.time() * 1000)}"
 
         logger.info(f"[{g.request_id}] {request.method} {request.url} from {request.remote_addr}")
 
-        # Log request headers in debug mode
-        if app.config.get('DEBUG'):
-            logger.debug(f"[{g.request_id}] Headers: {dict(request.headers)}")
+        # Log request headers in debug mode (skip copying headers when DEBUG logs are dropped)
+        if app.config.get('DEBUG') and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] Headers: %s", g.request_id, dict(request.headers))
 
     @app.after_request
     def log_response(response):
         """Log response information and timing."""
         if hasattr(g, 'start_time'):
-            duration = time.time() - g.start_time
+            duration = time.perf_counter() - g.start_time
             logger.info(f"[{g.request_id}] Response: {response.status_code} ({duration:.3f}s)")
 
         # Add request ID to response headers for debugging
@@ -183,6 +183,8 @@ def validate_json_request(required_fields=None):
         def create_user():
             # endpoint code
     """
+    required = frozenset(required_fields or ())
+
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
@@ -205,8 +207,8 @@ def validate_json_request(required_fields=None):
                     'timestamp': datetime.utcnow().isoformat()
                 }), 400
 
-            # Check required fields
-            if required_fields:
+            # Check required fields (single set comparison when all are present)
+            if required_fields and not (isinstance(data, dict) and required <= data.keys()):
                 missing_fields = [field for field in required_fields if field not in data]
                 if missing_fields:
                     logger.warning(f"Missing fields in {f.__name__}: {missing_fields}")